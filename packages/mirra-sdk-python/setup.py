@@ -33,9 +33,28 @@ setup(
     package_dir={"": "src"},
     python_requires=">=3.8",
     install_requires=[
+        "certifi>=2017.4.17",
+        "orjson>=3.9.0",
         "requests>=2.31.0",
+        "urllib3>=1.26.0",
     ],
     extras_require={
+        "async": [
+            "aiohttp>=3.8.0",
+        ],
+        "cache": [
+            "numpy>=1.22.0",
+        ],
+        "cache-hnsw": [
+            "numpy>=1.22.0",
+            "hnswlib>=0.7.0",
+        ],
+        "http2": [
+            "httpx[http2]>=0.24.0",
+        ],
+        "stream": [
+            "ijson>=3.2.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -5,6 +5,9 @@ Build, deploy, and monetize AI agents, serverless scripts, and API integrations.
 """
 
 from .client import MirraSDK
+from .aclient import AsyncMirraSDK
+from .prepared import PreparedEntity
+from .semcache import SemanticCache
 from .types import (
     ChatMessage,
     ChatRequest,
@@ -24,11 +27,20 @@ from .types import (
     Resource,
     Template,
     MarketplaceItem,
+    ROLES,
+    AGENT_STATUS,
+    RUNTIMES,
+    SCRIPT_STATUS,
+    RESOURCE_STATUS,
+    MARKETPLACE_TYPES,
 )
 
 __version__ = "0.1.0"
 __all__ = [
     "MirraSDK",
+    "AsyncMirraSDK",
+    "PreparedEntity",
+    "SemanticCache",
     "ChatMessage",
     "ChatRequest",
     "ChatResponse",
@@ -47,5 +59,11 @@ __all__ = [
     "Resource",
     "Template",
     "MarketplaceItem",
+    "ROLES",
+    "AGENT_STATUS",
+    "RUNTIMES",
+    "SCRIPT_STATUS",
+    "RESOURCE_STATUS",
+    "MARKETPLACE_TYPES",
 ]
 
@@ -0,0 +1,388 @@
+"""
+Mirra SDK Async Client
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Union
+
+import orjson
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from .client import (
+    _INVOKE_EMPTY,
+    _MARKETPLACE_SPEC,
+    _SCRIPT_SPEC,
+    MirraError,
+    _drop_none,
+    _unwrap_envelope,
+    _validate,
+)
+from .prepared import PreparedEntity, _encode_embedding
+from .types import (
+    MirraResponse,
+    MemoryEntity,
+    MemorySearchQuery,
+    MemorySearchResult,
+    MemoryQueryParams,
+    MemoryUpdateParams,
+    ChatRequest,
+    ChatResponse,
+    DecideRequest,
+    DecideResponse,
+    BatchChatRequest,
+    Agent,
+    CreateAgentParams,
+    UpdateAgentParams,
+    Script,
+    CreateScriptParams,
+    UpdateScriptParams,
+    InvokeScriptParams,
+    ScriptInvocationResult,
+    Resource,
+    CallResourceParams,
+    Template,
+    MarketplaceItem,
+    MarketplaceFilters,
+)
+
+
+class AsyncMirraSDK:
+    """
+    Asynchronous Python SDK for the Mirra API
+
+    Exposes the same service namespaces as :class:`MirraSDK`, with every
+    method returning a coroutine. Independent calls can be awaited together
+    (e.g. with ``asyncio.gather``) and share one keep-alive connection pool.
+    Requires the ``async`` extra: ``pip install mirra-sdk[async]``.
+
+    Args:
+        api_key: Your Mirra API key
+        base_url: Base URL for the API (default: https://api.fxn.world/api/sdk/v1)
+
+    Example:
+        >>> from mirra import AsyncMirraSDK
+        >>> async with AsyncMirraSDK(api_key="your_api_key") as mirra:
+        ...     response = await mirra.ai.chat({"messages": [{"role": "user", "content": "Hello!"}]})
+    """
+
+    __slots__ = (
+        "api_key", "base_url", "session",
+        "memory", "ai", "agents", "scripts", "resources", "templates", "marketplace",
+    )
+
+    # Service namespaces are created on first access (see __getattr__)
+    memory: "AsyncMemoryService"
+    ai: "AsyncAIService"
+    agents: "AsyncAgentService"
+    scripts: "AsyncScriptService"
+    resources: "AsyncResourceService"
+    templates: "AsyncTemplateService"
+    marketplace: "AsyncMarketplaceService"
+
+    _SERVICES: Dict[str, type] = {}
+
+    def __init__(self, api_key: str, base_url: str = "https://api.fxn.world/api/sdk/v1"):
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncMirraSDK requires aiohttp. Install it with: pip install mirra-sdk[async]"
+            )
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        # aiohttp sessions must be created inside a running event loop, so the
+        # session is built on first request rather than here.
+        self.session: Optional["aiohttp.ClientSession"] = None
+
+    def __getattr__(self, name: str) -> Any:
+        cls = type(self)._SERVICES.get(name)
+        if cls is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        service = cls(self)
+        # Cache on the instance so later lookups bypass __getattr__
+        object.__setattr__(self, name, service)
+        return service
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the HTTP session, creating it on first use"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                headers={
+                    "Content-Type": "application/json",
+                    "X-API-Key": self.api_key,
+                },
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300),
+            )
+        return self.session
+
+    async def __aenter__(self) -> "AsyncMirraSDK":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Union[Dict[str, Any], bytes]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Make an HTTP request to the API (``data`` may be pre-encoded JSON bytes)"""
+        url = f"{self.base_url}{path}"
+        if data is None or isinstance(data, bytes):
+            body = data
+        else:
+            body = orjson.dumps(data)
+
+        try:
+            async with self._get_session().request(
+                method,
+                url,
+                data=body,
+                params=_drop_none(params),
+            ) as response:
+                # Parse response
+                try:
+                    result: MirraResponse = orjson.loads(await response.read())
+                except orjson.JSONDecodeError:
+                    raise MirraError(
+                        f"Invalid JSON response from API",
+                        status_code=response.status
+                    )
+
+                return _unwrap_envelope(response.status, result)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise MirraError(f"Request failed: {str(e) or type(e).__name__}")
+
+
+class AsyncMemoryService:
+    """Memory operations"""
+
+    __slots__ = ("client",)
+
+    def __init__(self, client: AsyncMirraSDK):
+        self.client = client
+
+    async def create(self, entity: MemoryEntity, half_precision: bool = False) -> Dict[str, str]:
+        """
+        Create a new memory entity
+
+        Array embeddings are uploaded as base64 float32, or float16 when
+        ``half_precision`` is set.
+        """
+        return await self.client._request(
+            "POST", "/memory", data=_encode_embedding(entity, half_precision)
+        )
+
+    async def create_prepared(self, prepared: PreparedEntity, content: str) -> Dict[str, str]:
+        """Create a memory from a PreparedEntity, encoding only ``content``"""
+        return await self.client._request("POST", "/memory", data=prepared.encode(content))
+
+    async def search(self, query: MemorySearchQuery) -> List[MemorySearchResult]:
+        """Search memories by semantic similarity"""
+        return await self.client._request("POST", "/memory/search", data=query)
+
+    async def query(self, params: MemoryQueryParams) -> List[MemoryEntity]:
+        """Query memories with filters"""
+        return await self.client._request("POST", "/memory/query", data=params)
+
+    async def find_one(self, id: str) -> Optional[MemoryEntity]:
+        """Find a single memory by ID"""
+        return await self.client._request("POST", "/memory/findOne", data={"id": id})
+
+    async def update(self, id: str, updates: MemoryUpdateParams) -> Dict[str, bool]:
+        """Update a memory entity"""
+        payload = dict(updates)
+        payload["id"] = id
+        return await self.client._request("POST", "/memory/update", data=payload)
+
+    async def delete(self, id: str) -> Dict[str, bool]:
+        """Delete a memory entity"""
+        return await self.client._request("POST", "/memory/delete", data={"id": id})
+
+
+class AsyncAIService:
+    """AI operations"""
+
+    __slots__ = ("client",)
+
+    def __init__(self, client: AsyncMirraSDK):
+        self.client = client
+
+    async def chat(self, request: ChatRequest) -> ChatResponse:
+        """Send a chat request to the AI"""
+        return await self.client._request("POST", "/ai/chat", data=request)
+
+    async def decide(self, request: DecideRequest) -> DecideResponse:
+        """Ask AI to make a decision from options"""
+        return await self.client._request("POST", "/ai/decide", data=request)
+
+    async def batch_chat(self, request: BatchChatRequest) -> List[ChatResponse]:
+        """Process multiple chat requests in batch"""
+        return await self.client._request("POST", "/ai/batchChat", data=request)
+
+    async def batch_chat_parallel(self, request: BatchChatRequest) -> List[ChatResponse]:
+        """
+        Process multiple chat requests as concurrent ``/ai/chat`` calls
+
+        Each request is sent on its own, so one slow request does not hold
+        back the others. Results are returned in input order.
+        """
+        return list(await asyncio.gather(*(self.chat(r) for r in request["requests"])))
+
+
+class AsyncAgentService:
+    """Agent management operations"""
+
+    __slots__ = ("client",)
+
+    def __init__(self, client: AsyncMirraSDK):
+        self.client = client
+
+    async def create(self, params: CreateAgentParams) -> Agent:
+        """Create a new agent"""
+        return await self.client._request("POST", "/agents", data=params)
+
+    async def get(self, id: str) -> Agent:
+        """Get an agent by ID"""
+        return await self.client._request("GET", f"/agents/{id}")
+
+    async def list(self) -> List[Agent]:
+        """List all agents"""
+        return await self.client._request("GET", "/agents")
+
+    async def update(self, id: str, params: UpdateAgentParams) -> Agent:
+        """Update an agent"""
+        return await self.client._request("PATCH", f"/agents/{id}", data=params)
+
+    async def delete(self, id: str) -> Dict[str, bool]:
+        """Delete an agent"""
+        return await self.client._request("DELETE", f"/agents/{id}")
+
+
+class AsyncScriptService:
+    """Script operations"""
+
+    __slots__ = ("client",)
+
+    def __init__(self, client: AsyncMirraSDK):
+        self.client = client
+
+    async def create(self, params: CreateScriptParams) -> Script:
+        """Create a new script"""
+        # Skipped under `python -O`
+        if __debug__:
+            _validate(params, _SCRIPT_SPEC)
+        return await self.client._request("POST", "/scripts", data=params)
+
+    async def get(self, id: str) -> Script:
+        """Get a script by ID"""
+        return await self.client._request("GET", f"/scripts/{id}")
+
+    async def list(self) -> List[Script]:
+        """List all scripts"""
+        return await self.client._request("GET", "/scripts")
+
+    async def update(self, id: str, params: UpdateScriptParams) -> Script:
+        """Update a script"""
+        return await self.client._request("PATCH", f"/scripts/{id}", data=params)
+
+    async def delete(self, id: str) -> Dict[str, bool]:
+        """Delete a script"""
+        return await self.client._request("DELETE", f"/scripts/{id}")
+
+    async def deploy(self, id: str) -> Dict[str, bool]:
+        """Deploy a script"""
+        return await self.client._request("POST", f"/scripts/{id}/deploy")
+
+    async def invoke(self, params: InvokeScriptParams) -> ScriptInvocationResult:
+        """Invoke a script"""
+        script_id = params["scriptId"]
+        payload = params.get("payload")
+        return await self.client._request(
+            "POST",
+            f"/scripts/{script_id}/invoke",
+            data=_INVOKE_EMPTY if payload is None else {"payload": payload}
+        )
+
+
+class AsyncResourceService:
+    """Resource operations"""
+
+    __slots__ = ("client",)
+
+    def __init__(self, client: AsyncMirraSDK):
+        self.client = client
+
+    async def call(self, params: CallResourceParams) -> Any:
+        """Call a resource method"""
+        return await self.client._request("POST", "/resources/call", data=params)
+
+    async def list(self) -> List[Resource]:
+        """List available resources"""
+        return await self.client._request("GET", "/resources")
+
+    async def get(self, id: str) -> Resource:
+        """Get a resource by ID"""
+        return await self.client._request("GET", f"/resources/{id}")
+
+
+class AsyncTemplateService:
+    """Template operations"""
+
+    __slots__ = ("client",)
+
+    def __init__(self, client: AsyncMirraSDK):
+        self.client = client
+
+    async def list(self) -> List[Template]:
+        """List available templates"""
+        return await self.client._request("GET", "/templates")
+
+    async def get(self, id: str) -> Template:
+        """Get a template by ID"""
+        return await self.client._request("GET", f"/templates/{id}")
+
+    async def install(self, id: str) -> Dict[str, bool]:
+        """Install a template"""
+        return await self.client._request("POST", f"/templates/{id}/install")
+
+
+class AsyncMarketplaceService:
+    """Marketplace operations"""
+
+    __slots__ = ("client",)
+
+    def __init__(self, client: AsyncMirraSDK):
+        self.client = client
+
+    async def browse(self, filters: Optional[MarketplaceFilters] = None) -> List[MarketplaceItem]:
+        """Browse marketplace items"""
+        if __debug__:
+            _validate(filters, _MARKETPLACE_SPEC)
+        return await self.client._request("GET", "/marketplace", params=filters)
+
+    async def search(self, query: str) -> List[MarketplaceItem]:
+        """Search marketplace"""
+        return await self.client._request("GET", "/marketplace/search", params={"q": query})
+
+
+AsyncMirraSDK._SERVICES = {
+    "memory": AsyncMemoryService,
+    "ai": AsyncAIService,
+    "agents": AsyncAgentService,
+    "scripts": AsyncScriptService,
+    "resources": AsyncResourceService,
+    "templates": AsyncTemplateService,
+    "marketplace": AsyncMarketplaceService,
+}
@@ -2,8 +2,48 @@
 Mirra SDK Client
 """
 
+import os
+import threading
+import time
+import urllib.request
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+
+import certifi
+import orjson
 import requests
-from typing import Any, Dict, List, Optional
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as URLLib3HTTPError
+from urllib3.util import Retry, make_headers, parse_url
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from .prepared import PreparedEntity, _encode_embedding
+from .semcache import SemanticCache, make_scope
 from .types import (
     MirraResponse,
     MemoryEntity,
@@ -29,9 +69,35 @@ from .types import (
     Template,
     MarketplaceItem,
     MarketplaceFilters,
+    MARKETPLACE_TYPES,
+    RUNTIMES,
+)
+
+
+# Chunk size when reading streamed response bodies
+_STREAM_CHUNK = 64 * 1024
+
+# Exceptions raised by either HTTP transport
+_TRANSPORT_ERRORS = (requests.RequestException, URLLib3HTTPError) + (
+    (httpx.HTTPError,) if httpx is not None else ()
 )
 
 
+class _ThrottleRetry(Retry):
+    """
+    Retry policy that only re-sends non-idempotent requests on 429
+
+    5xx responses and read errors are retried for the methods in
+    ``allowed_methods`` (GET/DELETE). A 429 means the server rejected the
+    request without processing it, so POST and PATCH are retried too.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if status_code == 429:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+
 class MirraError(Exception):
     """Base exception for Mirra SDK errors"""
 
@@ -49,114 +115,600 @@ class MirraSDK:
     Args:
         api_key: Your Mirra API key
         base_url: Base URL for the API (default: https://api.fxn.world/api/sdk/v1)
+        cache: Optional SemanticCache for ``ai.chat`` and ``memory.search``
+        http2: Send all requests over a multiplexed HTTP/2 connection via httpx
+            (requires ``pip install mirra-sdk[http2]``)
     
+    Use it as a context manager (or call :meth:`close`) to release pooled
+    connections and background threads when done.
+
+    Read-only GETs (``agents.get``, ``resources.list``/``get`` and
+    ``templates.list``/``get``) bypass ``session`` and use a bare urllib3
+    pool. That pool picks up proxies from the environment and the CA bundle
+    from ``REQUESTS_CA_BUNDLE``/``CURL_CA_BUNDLE`` (default: certifi), but
+    later changes to ``session`` (proxies, ``verify``, headers, adapters)
+    do not apply to it.
+
     Example:
         >>> from mirra import MirraSDK
-        >>> mirra = MirraSDK(api_key="your_api_key")
-        >>> response = mirra.ai.chat({"messages": [{"role": "user", "content": "Hello!"}]})
+        >>> with MirraSDK(api_key="your_api_key") as mirra:
+        ...     response = mirra.ai.chat({"messages": [{"role": "user", "content": "Hello!"}]})
     """
 
-    def __init__(self, api_key: str, base_url: str = "https://api.fxn.world/api/sdk/v1"):
+    __slots__ = (
+        "api_key", "base_url", "cache", "session", "http2",
+        "_get", "_post", "_methods",
+        "_url_agents", "_url_scripts", "_url_marketplace", "_url_marketplace_search",
+        "_pool", "_executor", "_executor_lock", "_pending",
+        "memory", "ai", "agents", "scripts", "resources", "templates", "marketplace",
+    )
+
+    # requests.Session, or httpx.Client when http2=True
+    session: Union[requests.Session, "httpx.Client"]
+    _pool: Optional[urllib3.PoolManager]
+    _methods: Dict[str, Callable[..., Any]]
+
+    # Service namespaces are created on first access (see __getattr__)
+    memory: "MemoryService"
+    ai: "AIService"
+    agents: "AgentService"
+    scripts: "ScriptService"
+    resources: "ResourceService"
+    templates: "TemplateService"
+    marketplace: "MarketplaceService"
+
+    _SERVICES: Dict[str, type] = {}
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.fxn.world/api/sdk/v1",
+        cache: Optional[SemanticCache] = None,
+        http2: bool = False,
+    ):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
+        self.cache = cache
+        self.http2 = http2
+        if http2:
+            self._init_http2()
+        else:
+            self._init_http1()
+
+        # Background pool for prefetches, created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        # Prefetches not yet finished, so close() can cancel the queued ones
+        self._pending: Set["Future[Any]"] = set()
+
+        # Precompute fixed endpoint URLs for hot paths
+        self._url_agents = f"{self.base_url}/agents"
+        self._url_scripts = f"{self.base_url}/scripts"
+        self._url_marketplace = f"{self.base_url}/marketplace"
+        self._url_marketplace_search = f"{self.base_url}/marketplace/search"
+
+    def _init_http1(self) -> None:
+        """Use a pooled requests session, plus a bare urllib3 pool for GETs"""
         self.session = requests.Session()
         self.session.headers.update({
             "Content-Type": "application/json",
-            "X-API-Key": api_key,
+            "X-API-Key": self.api_key,
         })
+        # Only advertise brotli when urllib3 can decode it
+        accept_encoding = make_headers(accept_encoding=True)
+        self.session.headers.update(accept_encoding)
+
+        # Size the pool for threaded callers and retry transient failures
+        retries = _ThrottleRetry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "DELETE"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retries)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Bare urllib3 pool for read-only GETs, skipping requests' per-call overhead
+        self._pool = _make_pool(
+            self.base_url,
+            headers={"X-API-Key": self.api_key, **accept_encoding},
+            retries=retries,
+        )
 
-        # Initialize service namespaces
-        self.memory = MemoryService(self)
-        self.ai = AIService(self)
-        self.agents = AgentService(self)
-        self.scripts = ScriptService(self)
-        self.resources = ResourceService(self)
-        self.templates = TemplateService(self)
-        self.marketplace = MarketplaceService(self)
+        # Pre-bind HTTP verbs for hot paths
+        self._get = self.session.get
+        self._post = self.session.post
+        self._methods = {
+            "GET": self._get,
+            "POST": self._post,
+            "PATCH": self.session.patch,
+            "DELETE": self.session.delete,
+        }
+
+    def _init_http2(self) -> None:
+        """Use one httpx HTTP/2 client for every request"""
+        if httpx is None:
+            raise ImportError(
+                "HTTP/2 support requires httpx. Install it with: pip install mirra-sdk[http2]"
+            )
+        self.session = httpx.Client(
+            http2=True,
+            headers={
+                "Content-Type": "application/json",
+                "X-API-Key": self.api_key,
+            },
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+            timeout=30.0,
+        )
+        # Concurrent calls share streams on one connection, so no urllib3 pool
+        self._pool = None
+        self._get = _httpx_sender(self.session, "GET")
+        self._post = _httpx_sender(self.session, "POST")
+        self._methods = {
+            "GET": self._get,
+            "POST": self._post,
+            "PATCH": _httpx_sender(self.session, "PATCH"),
+            "DELETE": _httpx_sender(self.session, "DELETE"),
+        }
+
+    def __enter__(self) -> "MirraSDK":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close pooled connections and stop the background executor"""
+        self.session.close()
+        if self._pool is not None:
+            self._pool.clear()
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            # shutdown(cancel_futures=True) is 3.9+, so cancel queued work by hand
+            for future in list(self._pending):
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def __getattr__(self, name: str) -> Any:
+        cls = type(self)._SERVICES.get(name)
+        if cls is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        service = cls(self)
+        # Cache on the instance so later lookups bypass __getattr__
+        object.__setattr__(self, name, service)
+        return service
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the shared background executor, creating it on first use"""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=8, thread_name_prefix="mirra-prefetch"
+                    )
+        return self._executor
 
     def _request(
         self,
         method: str,
         path: str,
-        data: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[Dict[str, Any], bytes]] = None,
         params: Optional[Dict[str, Any]] = None,
     ) -> Any:
-        """Make an HTTP request to the API"""
-        url = f"{self.base_url}{path}"
-        
+        """Make an HTTP request to the API (``data`` may be pre-encoded JSON bytes)"""
+        if data is None or isinstance(data, bytes):
+            body = data
+        else:
+            body = orjson.dumps(data)
+        return self._send(self._methods[method], f"{self.base_url}{path}", body, params)
+
+    def _get_url(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET a precomputed URL"""
+        return self._send(self._get, url, None, params)
+
+    def _post_url(self, url: str, data: Optional[Dict[str, Any]] = None) -> Any:
+        """POST to a precomputed URL"""
+        body = orjson.dumps(data) if data is not None else None
+        return self._send(self._post, url, body, None)
+
+    def _send(
+        self,
+        send: Callable[..., Any],
+        url: str,
+        body: Optional[bytes],
+        params: Optional[Dict[str, Any]],
+    ) -> Any:
+        """Send a request with a pre-bound session method and unwrap the response"""
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                json=data,
-                params=params,
+            response = send(url, data=body, params=params)
+            content = response.content
+        except _TRANSPORT_ERRORS as e:
+            raise MirraError(f"Request failed: {str(e)}")
+        return self._unwrap(response.status_code, content)
+
+    def _raw_get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET through the bare urllib3 pool (read-only endpoints only)"""
+        if self._pool is None:
+            return self._send(self._get, f"{self.base_url}{path}", None, params)
+        try:
+            response = self._pool.request(
+                "GET", f"{self.base_url}{path}", fields=_drop_none(params)
             )
-            
-            # Parse response
-            try:
-                result: MirraResponse = response.json()
-            except ValueError:
-                raise MirraError(
-                    f"Invalid JSON response from API",
-                    status_code=response.status_code
-                )
-            
-            # Check for errors
-            if not result.get("success", False) or response.status_code >= 400:
-                error = result.get("error", {})
-                raise MirraError(
-                    message=error.get("message", "Unknown error"),
-                    code=error.get("code"),
-                    status_code=response.status_code,
-                    details=error.get("details"),
+        except URLLib3HTTPError as e:
+            raise MirraError(f"Request failed: {str(e)}")
+        return self._unwrap(response.status, response.data)
+
+    def _request_stream(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        item_prefix: str = "data.item",
+    ) -> Iterator[Any]:
+        """
+        Make an HTTP request and yield items of a JSON array as they arrive
+
+        The response body is decoded incrementally, so the full payload is
+        never held in memory at once. A ``{"success": false}`` envelope raises
+        MirraError once the body has been read. Requires the ``stream`` extra.
+        """
+        if ijson is None:
+            raise ImportError(
+                "Streaming requires ijson. Install it with: pip install mirra-sdk[stream]"
+            )
+        body = orjson.dumps(data) if data is not None else None
+        url = f"{self.base_url}{path}"
+        session = self.session
+        try:
+            if httpx is not None and isinstance(session, httpx.Client):
+                request = session.build_request(
+                    method, url, content=body, params=_drop_none(params)
                 )
-            
-            return result.get("data")
-            
-        except requests.RequestException as e:
+                response = session.send(request, stream=True)
+                chunks = response.iter_bytes(_STREAM_CHUNK)
+            else:
+                response = self._methods[method](url, data=body, params=params, stream=True)
+                chunks = response.iter_content(_STREAM_CHUNK)
+        except _TRANSPORT_ERRORS as e:
+            raise MirraError(f"Request failed: {str(e)}")
+
+        try:
+            if response.status_code >= 400:
+                self._unwrap(response.status_code, b"".join(chunks))
+            # Feed decoded chunks to ijson and yield items as they complete,
+            # while collecting the envelope's success/error fields
+            items: List[Any] = []
+            envelope: Dict[str, Any] = {}
+            sink = _envelope_sink(items, envelope, item_prefix)
+            next(sink)
+            parser = ijson.parse_coro(sink, use_float=True)
+            for chunk in chunks:
+                parser.send(chunk)
+                if envelope.get("success") is not False:
+                    yield from items
+                del items[:]
+            parser.close()
+            if not envelope.get("success"):
+                raise _api_error(response.status_code, envelope)
+            yield from items
+        except ijson.JSONError:
+            raise MirraError(
+                f"Invalid JSON response from API",
+                status_code=response.status_code
+            )
+        except _TRANSPORT_ERRORS as e:
             raise MirraError(f"Request failed: {str(e)}")
+        finally:
+            response.close()
+
+    def _unwrap(self, status: int, content: bytes) -> Any:
+        """Parse a response envelope, returning its data or raising MirraError"""
+        # Parse response
+        try:
+            result: MirraResponse = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            raise MirraError(
+                f"Invalid JSON response from API",
+                status_code=status
+            )
+
+        return _unwrap_envelope(status, result)
+
+
+def _unwrap_envelope(status: int, result: MirraResponse) -> Any:
+    """Return the data of a decoded response envelope, or raise MirraError"""
+    if status < 400 and result.get("success"):
+        return result.get("data")
+    raise _api_error(status, result)
+
+
+def _api_error(status: int, result: Mapping[str, Any]) -> MirraError:
+    """Build the MirraError for a failed response envelope"""
+    error = result.get("error") or {}
+    return MirraError(
+        message=error.get("message", "Unknown error"),
+        code=error.get("code"),
+        status_code=status,
+        details=error.get("details"),
+    )
+
+
+def _envelope_sink(
+    items: List[Any], envelope: Dict[str, Any], item_prefix: str
+) -> Generator[None, Tuple[str, str, Any], None]:
+    """
+    ijson event target collecting values under ``item_prefix`` into ``items``
+
+    The top-level ``success`` and ``error`` fields are stored in ``envelope``
+    so a 2xx ``{"success": false}`` reply can still be detected.
+    """
+    builder = None
+    depth = 0
+    target: Optional[str] = None
+    while True:
+        prefix, event, value = yield
+        if builder is None:
+            if prefix == item_prefix:
+                target = None
+            elif prefix in ("success", "error") and event != "map_key":
+                target = prefix
+            else:
+                continue
+            if event not in ("start_map", "start_array"):
+                if target is None:
+                    items.append(value)
+                else:
+                    envelope[target] = value
+                continue
+            builder = ijson.ObjectBuilder()
+        builder.event(event, value)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+        if not depth:
+            if target is None:
+                items.append(builder.value)
+            else:
+                envelope[target] = builder.value
+            builder = None
+
+
+def _make_pool(base_url: str, **kwargs: Any) -> urllib3.PoolManager:
+    """Build the bare GET pool with the same proxy and CA settings requests uses"""
+    kwargs.update(
+        num_pools=4,
+        maxsize=32,
+        ca_certs=os.environ.get("REQUESTS_CA_BUNDLE")
+        or os.environ.get("CURL_CA_BUNDLE")
+        or certifi.where(),
+    )
+    url = parse_url(base_url)
+    proxy = urllib.request.getproxies().get(url.scheme or "https")
+    if not proxy or urllib.request.proxy_bypass(url.host or ""):
+        return urllib3.PoolManager(**kwargs)
+    auth = parse_url(proxy).auth
+    return urllib3.ProxyManager(
+        proxy,
+        proxy_headers=make_headers(proxy_basic_auth=auth) if auth else None,
+        **kwargs,
+    )
+
+
+def _httpx_sender(client: "httpx.Client", method: str) -> Callable[..., Any]:
+    """Adapt an httpx client to the ``send(url, data=, params=)`` shape of requests"""
+
+    def send(
+        url: str,
+        data: Optional[bytes] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> "httpx.Response":
+        return client.request(method, url, content=data, params=_drop_none(params))
+
+    return send
+
+
+def _drop_none(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Remove None-valued query params, which requests omits but the other transports send or reject"""
+    if not params:
+        return params
+    return {k: v for k, v in params.items() if v is not None}
+
+
+def _validate(params: Optional[Dict[str, Any]], spec: Dict[str, FrozenSet[str]]) -> None:
+    """Reject Literal-typed fields whose value is not in the allowed set"""
+    if not params:
+        return
+    for field, allowed in spec.items():
+        value = params.get(field)
+        if value is not None and value not in allowed:
+            raise MirraError(
+                f"Invalid {field} {value!r}, expected one of: {', '.join(sorted(allowed))}",
+                code="INVALID_PARAMS",
+            )
+
+
+_SCRIPT_SPEC = {"runtime": RUNTIMES}
+_MARKETPLACE_SPEC = {"type": MARKETPLACE_TYPES}
+
+
+class PrefetchMap(Mapping[str, Any]):
+    """
+    Results of a background prefetch, keyed by ID
+
+    Looking up an ID blocks only until that ID's request has finished, and
+    re-raises its error if it failed. Membership tests never block.
+    """
+
+    __slots__ = ("_futures",)
+
+    def __init__(self, futures: Dict[str, "Future[Any]"]):
+        self._futures = futures
+
+    def __getitem__(self, id: str) -> Any:
+        return self._futures[id].result()
+
+    def __contains__(self, id: object) -> bool:
+        return id in self._futures
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._futures)
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    def as_completed(self) -> Iterator[Tuple[str, Any]]:
+        """Yield ``(id, result)`` pairs in the order requests finish"""
+        ids = {future: id for id, future in self._futures.items()}
+        for future in as_completed(ids):
+            yield ids[future], future.result()
+
+
+def _prefetch(client: "MirraSDK", fetch: Callable[[str], Any], ids: Iterable[str]) -> PrefetchMap:
+    """Schedule ``fetch(id)`` once per distinct ID on the client's background executor"""
+    executor = client._get_executor()
+    futures = {}
+    for id in dict.fromkeys(ids):
+        future = executor.submit(fetch, id)
+        client._pending.add(future)
+        future.add_done_callback(client._pending.discard)
+        futures[id] = future
+    return PrefetchMap(futures)
+
+
+def _retry_after(error: MirraError) -> float:
+    """Seconds to back off after a 429, from ``details.retryAfter`` when present"""
+    details = error.details
+    if isinstance(details, dict):
+        try:
+            return max(0.0, float(details["retryAfter"]))
+        except (KeyError, TypeError, ValueError):
+            pass
+    return _DEFAULT_RETRY_AFTER
+
+
+# Adaptive fan-out: start small, grow by one per success, halve on a 429
+_INITIAL_CONCURRENCY = 4
+_MAX_THROTTLE_RETRIES = 5
+_DEFAULT_RETRY_AFTER = 1.0
+
+
+# Shared request body for invoking a script without a payload
+_INVOKE_EMPTY: Dict[str, Any] = {"payload": None}
+
+
+def _cached_call(
+    cache: SemanticCache,
+    namespace: str,
+    text: Optional[str],
+    params: Dict[str, Any],
+    fetch: Callable[[], Any],
+) -> Any:
+    """Serve ``fetch()`` through the semantic cache, keyed on ``text``"""
+    if not isinstance(text, str):
+        return fetch()
+    vec = cache.embed(text)
+    scope = make_scope(namespace, params)
+    hit = cache.lookup(vec, scope)
+    if hit is not None:
+        return hit
+    result = fetch()
+    cache.put(vec, result, scope)
+    return result
 
 
 class MemoryService:
     """Memory operations"""
 
-    def __init__(self, client: MirraSDK):
+    __slots__ = ("client", "cache")
+
+    def __init__(self, client: MirraSDK, cache: Optional[SemanticCache] = None):
         self.client = client
+        self.cache = client.cache if cache is None else cache
+
+    def create(self, entity: MemoryEntity, half_precision: bool = False) -> Dict[str, str]:
+        """
+        Create a new memory entity
+
+        Array embeddings are uploaded as base64 float32, or float16 when
+        ``half_precision`` is set.
+        """
+        return self._write("/memory", _encode_embedding(entity, half_precision))
 
-    def create(self, entity: MemoryEntity) -> Dict[str, str]:
-        """Create a new memory entity"""
-        return self.client._request("POST", "/memory", data=entity)
+    def create_prepared(self, prepared: PreparedEntity, content: str) -> Dict[str, str]:
+        """Create a memory from a PreparedEntity, encoding only ``content``"""
+        return self._write("/memory", prepared.encode(content))
 
     def search(self, query: MemorySearchQuery) -> List[MemorySearchResult]:
         """Search memories by semantic similarity"""
-        return self.client._request("POST", "/memory/search", data=query)
+        if self.cache is None:
+            return self.client._request("POST", "/memory/search", data=query)
+        return _cached_call(
+            self.cache,
+            "memory.search",
+            query.get("query"),
+            {k: v for k, v in query.items() if k != "query"},
+            lambda: self.client._request("POST", "/memory/search", data=query),
+        )
 
     def query(self, params: MemoryQueryParams) -> List[MemoryEntity]:
         """Query memories with filters"""
         return self.client._request("POST", "/memory/query", data=params)
 
+    def iter_query(self, params: MemoryQueryParams) -> Iterator[MemoryEntity]:
+        """Query memories with filters, yielding results as they are received"""
+        return self.client._request_stream("POST", "/memory/query", data=params)
+
     def find_one(self, id: str) -> Optional[MemoryEntity]:
         """Find a single memory by ID"""
         return self.client._request("POST", "/memory/findOne", data={"id": id})
 
     def update(self, id: str, updates: MemoryUpdateParams) -> Dict[str, bool]:
         """Update a memory entity"""
-        return self.client._request("POST", "/memory/update", data={"id": id, **updates})
+        payload = dict(updates)
+        payload["id"] = id
+        return self._write("/memory/update", payload)
 
     def delete(self, id: str) -> Dict[str, bool]:
         """Delete a memory entity"""
-        return self.client._request("POST", "/memory/delete", data={"id": id})
+        return self._write("/memory/delete", {"id": id})
+
+    def _write(self, path: str, data: Union[Dict[str, Any], bytes]) -> Any:
+        """POST a memory write and drop cached searches it may have made stale"""
+        try:
+            return self.client._request("POST", path, data=data)
+        finally:
+            # Also on failure: a timed-out write may still have been applied
+            if self.cache is not None:
+                self.cache.clear("memory.search")
 
 
 class AIService:
     """AI operations"""
 
-    def __init__(self, client: MirraSDK):
+    __slots__ = ("client", "cache", "_concurrency")
+
+    def __init__(self, client: MirraSDK, cache: Optional[SemanticCache] = None):
         self.client = client
+        self.cache = client.cache if cache is None else cache
+        # Current fan-out limit for batch_chat_parallel, kept across calls
+        self._concurrency = _INITIAL_CONCURRENCY
 
     def chat(self, request: ChatRequest) -> ChatResponse:
         """Send a chat request to the AI"""
-        return self.client._request("POST", "/ai/chat", data=request)
+        messages = request.get("messages")
+        if self.cache is None or not messages or messages[-1].get("role") != "user":
+            return self.client._request("POST", "/ai/chat", data=request)
+        return _cached_call(
+            self.cache,
+            "ai.chat",
+            messages[-1].get("content"),
+            {**request, "messages": messages[:-1]},
+            lambda: self.client._request("POST", "/ai/chat", data=request),
+        )
 
     def decide(self, request: DecideRequest) -> DecideResponse:
         """Ask AI to make a decision from options"""
@@ -166,24 +718,102 @@ class AIService:
         """Process multiple chat requests in batch"""
         return self.client._request("POST", "/ai/batchChat", data=request)
 
+    def batch_chat_parallel(
+        self, request: BatchChatRequest, max_concurrency: int = 32
+    ) -> List[ChatResponse]:
+        """
+        Process multiple chat requests as concurrent ``/ai/chat`` calls
+
+        Requests are sent from a thread pool over the shared session, so one
+        slow request does not hold back the others. Results are returned in
+        input order. Prefer :meth:`batch_chat` when the server can amortize
+        model load across the whole batch.
+
+        Concurrency adapts to throttling: it grows by one per success (up to
+        ``max_concurrency``) and halves when a request is rate limited (HTTP
+        429), at most once per backoff window. Throttled requests are requeued
+        after the server's ``retryAfter`` delay, up to a few times each.
+
+        On the default HTTP/1.1 transport each call has already been through
+        the session's own 429 handling (up to 3 retries, sleeping on
+        ``Retry-After``), so concurrency only adapts once those are exhausted. Any other error cancels the
+        requests that have not started and is raised.
+        """
+        pending = deque((index, chat, 0) for index, chat in enumerate(request["requests"]))
+        results: List[Any] = [None] * len(pending)
+        in_flight: Dict["Future[ChatResponse]", Tuple[int, Any, int]] = {}
+        resume_at = 0.0
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+            while pending or in_flight:
+                now = time.monotonic()
+                if now >= resume_at:
+                    limit = min(self._concurrency, max_concurrency)
+                    while pending and len(in_flight) < limit:
+                        index, chat, attempts = pending.popleft()
+                        in_flight[pool.submit(self.chat, chat)] = (index, chat, attempts)
+                    timeout = None
+                else:
+                    timeout = resume_at - now
+                if not in_flight:
+                    time.sleep(resume_at - now)
+                    continue
+
+                done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, chat, attempts = in_flight.pop(future)
+                    try:
+                        results[index] = future.result()
+                    except MirraError as e:
+                        if e.status_code != 429 or attempts >= _MAX_THROTTLE_RETRIES:
+                            for other in in_flight:
+                                other.cancel()
+                            raise
+                        now = time.monotonic()
+                        # Halve once per backoff window, not once per throttled request
+                        if now >= resume_at:
+                            self._concurrency = max(1, self._concurrency // 2)
+                        resume_at = max(resume_at, now + _retry_after(e))
+                        pending.appendleft((index, chat, attempts + 1))
+                    else:
+                        self._concurrency = min(max_concurrency, self._concurrency + 1)
+
+        return results
+
 
 class AgentService:
     """Agent management operations"""
 
+    __slots__ = ("client",)
+
     def __init__(self, client: MirraSDK):
         self.client = client
 
     def create(self, params: CreateAgentParams) -> Agent:
         """Create a new agent"""
-        return self.client._request("POST", "/agents", data=params)
+        return self.client._post_url(self.client._url_agents, params)
 
     def get(self, id: str) -> Agent:
         """Get an agent by ID"""
-        return self.client._request("GET", f"/agents/{id}")
+        return self.client._raw_get(f"/agents/{id}")
+
+    def prefetch(self, ids: Iterable[str]) -> PrefetchMap:
+        """
+        Fetch agents concurrently in the background
+
+        Example:
+            >>> agents = mirra.agents.prefetch(a["id"] for a in mirra.agents.list())
+            >>> agents[some_id]  # blocks only for this agent
+        """
+        return _prefetch(self.client, self.get, ids)
 
     def list(self) -> List[Agent]:
         """List all agents"""
-        return self.client._request("GET", "/agents")
+        return self.client._get_url(self.client._url_agents)
+
+    def iter_list(self) -> Iterator[Agent]:
+        """List all agents, yielding them as they are received"""
+        return self.client._request_stream("GET", "/agents")
 
     def update(self, id: str, params: UpdateAgentParams) -> Agent:
         """Update an agent"""
@@ -197,20 +827,29 @@ class AgentService:
 class ScriptService:
     """Script operations"""
 
+    __slots__ = ("client",)
+
     def __init__(self, client: MirraSDK):
         self.client = client
 
     def create(self, params: CreateScriptParams) -> Script:
         """Create a new script"""
-        return self.client._request("POST", "/scripts", data=params)
+        # Skipped under `python -O`
+        if __debug__:
+            _validate(params, _SCRIPT_SPEC)
+        return self.client._post_url(self.client._url_scripts, params)
 
     def get(self, id: str) -> Script:
         """Get a script by ID"""
         return self.client._request("GET", f"/scripts/{id}")
 
+    def prefetch(self, ids: Iterable[str]) -> PrefetchMap:
+        """Fetch scripts concurrently in the background (see ``AgentService.prefetch``)"""
+        return _prefetch(self.client, self.get, ids)
+
     def list(self) -> List[Script]:
         """List all scripts"""
-        return self.client._request("GET", "/scripts")
+        return self.client._get_url(self.client._url_scripts)
 
     def update(self, id: str, params: UpdateScriptParams) -> Script:
         """Update a script"""
@@ -231,13 +870,15 @@ class ScriptService:
         return self.client._request(
             "POST",
             f"/scripts/{script_id}/invoke",
-            data={"payload": payload}
+            data=_INVOKE_EMPTY if payload is None else {"payload": payload}
         )
 
 
 class ResourceService:
     """Resource operations"""
 
+    __slots__ = ("client",)
+
     def __init__(self, client: MirraSDK):
         self.client = client
 
@@ -247,26 +888,28 @@ class ResourceService:
 
     def list(self) -> List[Resource]:
         """List available resources"""
-        return self.client._request("GET", "/resources")
+        return self.client._raw_get("/resources")
 
     def get(self, id: str) -> Resource:
         """Get a resource by ID"""
-        return self.client._request("GET", f"/resources/{id}")
+        return self.client._raw_get(f"/resources/{id}")
 
 
 class TemplateService:
     """Template operations"""
 
+    __slots__ = ("client",)
+
     def __init__(self, client: MirraSDK):
         self.client = client
 
     def list(self) -> List[Template]:
         """List available templates"""
-        return self.client._request("GET", "/templates")
+        return self.client._raw_get("/templates")
 
     def get(self, id: str) -> Template:
         """Get a template by ID"""
-        return self.client._request("GET", f"/templates/{id}")
+        return self.client._raw_get(f"/templates/{id}")
 
     def install(self, id: str) -> Dict[str, bool]:
         """Install a template"""
@@ -276,14 +919,34 @@ class TemplateService:
 class MarketplaceService:
     """Marketplace operations"""
 
+    __slots__ = ("client",)
+
     def __init__(self, client: MirraSDK):
         self.client = client
 
     def browse(self, filters: Optional[MarketplaceFilters] = None) -> List[MarketplaceItem]:
         """Browse marketplace items"""
-        return self.client._request("GET", "/marketplace", params=filters)
+        if __debug__:
+            _validate(filters, _MARKETPLACE_SPEC)
+        return self.client._get_url(self.client._url_marketplace, params=filters)
+
+    def iter_browse(self, filters: Optional[MarketplaceFilters] = None) -> Iterator[MarketplaceItem]:
+        """Browse marketplace items, yielding them as they are received"""
+        if __debug__:
+            _validate(filters, _MARKETPLACE_SPEC)
+        return self.client._request_stream("GET", "/marketplace", params=filters)
 
     def search(self, query: str) -> List[MarketplaceItem]:
         """Search marketplace"""
-        return self.client._request("GET", "/marketplace/search", params={"q": query})
-
+        return self.client._get_url(self.client._url_marketplace_search, params={"q": query})
+
+
+MirraSDK._SERVICES = {
+    "memory": MemoryService,
+    "ai": AIService,
+    "agents": AgentService,
+    "scripts": ScriptService,
+    "resources": ResourceService,
+    "templates": TemplateService,
+    "marketplace": MarketplaceService,
+}
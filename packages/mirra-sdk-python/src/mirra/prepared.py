@@ -0,0 +1,75 @@
+"""
+Mirra SDK Prepared Entities
+"""
+
+import base64
+from typing import Literal, Sequence
+
+import orjson
+
+from .types import MemoryEntity
+
+
+def _encode_embedding(entity: MemoryEntity, half_precision: bool = False) -> MemoryEntity:
+    """
+    Pack an array or bytes embedding as base64 little-endian floats
+
+    Arrays are cast to float32 (or float16 with ``half_precision``); raw bytes
+    are assumed to already be float32. Lists, tuples and other sequences are
+    sent unchanged.
+    """
+    embedding = entity.get("embedding")
+    encoding: Literal["f32b64", "f16b64"]
+    if embedding is None:
+        return entity
+    if isinstance(embedding, (bytes, bytearray, memoryview)):
+        raw, encoding = bytes(embedding), "f32b64"
+    elif hasattr(embedding, "astype") and hasattr(embedding, "tobytes"):
+        if half_precision:
+            dtype, encoding = "<f2", "f16b64"
+        else:
+            dtype, encoding = "<f4", "f32b64"
+        raw = embedding.astype(dtype).tobytes()
+    elif isinstance(embedding, Sequence):
+        return entity
+    else:
+        raise TypeError(
+            f"Unsupported embedding type {type(embedding).__name__!r}, "
+            "expected a sequence of floats, an array or bytes"
+        )
+    return {
+        **entity,
+        "embedding": base64.b64encode(raw).decode("ascii"),
+        "embedding_encoding": encoding,
+    }
+
+
+class PreparedEntity:
+    """
+    Memory entity whose constant fields are JSON-encoded once
+
+    Useful for ingestion loops that create many memories sharing the same
+    ``type``/``metadata``: only ``content`` is encoded per call.
+
+    Args:
+        fields: Entity fields shared by every memory (``content`` is ignored)
+        half_precision: Pack an array ``embedding`` as float16 instead of float32
+
+    Example:
+        >>> from mirra import MirraSDK, PreparedEntity
+        >>> note = PreparedEntity({"type": "note", "metadata": {"source": "import"}})
+        >>> for text in texts:
+        ...     mirra.memory.create_prepared(note, text)
+    """
+
+    __slots__ = ("static",)
+
+    def __init__(self, fields: MemoryEntity, half_precision: bool = False):
+        fields = _encode_embedding(fields, half_precision)
+        static = {k: v for k, v in fields.items() if k != "content"}
+        # Drop the closing brace so each body only appends the content field
+        self.static = orjson.dumps(static)[:-1] + (b',"content":' if static else b'"content":')
+
+    def encode(self, content: str) -> bytes:
+        """Build the full request body for ``content``"""
+        return self.static + orjson.dumps(content) + b"}"
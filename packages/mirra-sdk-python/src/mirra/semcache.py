@@ -0,0 +1,313 @@
+"""
+Mirra SDK Semantic Cache
+"""
+
+import math
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+import orjson
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    import hnswlib
+except ImportError:  # pragma: no cover - optional dependency
+    hnswlib = None
+
+
+EmbedFn = Callable[[str], Sequence[float]]
+
+# 8 tables of 8 bits find a 0.9-cosine neighbour with ~94% probability
+_LSH_TABLES = 8
+_LSH_BITS = 8
+
+
+def make_scope(namespace: str, params: Dict[str, Any]) -> bytes:
+    """
+    Build the exact-match partition key for a cached call
+
+    Entries only match when everything except the embedded text (model,
+    earlier messages, limits, filters, ...) is identical.
+    """
+    return namespace.encode() + b":" + orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+
+
+class _FlatIndex:
+    """Brute-force cosine index over an L2-normalized float32 matrix"""
+
+    def __init__(self, dim: int):
+        self.dim = dim
+        self.matrix = np.empty((16, dim), dtype=np.float32)
+        self.ids: list = []
+        self.rows: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, id: int, vec: "np.ndarray") -> None:
+        row = len(self.ids)
+        if row == self.matrix.shape[0]:
+            grown = np.empty((row * 2, self.dim), dtype=np.float32)
+            grown[:row] = self.matrix
+            self.matrix = grown
+        self.matrix[row] = vec
+        self.ids.append(id)
+        self.rows[id] = row
+
+    def remove(self, id: int) -> None:
+        row = self.rows.pop(id)
+        last = len(self.ids) - 1
+        if row != last:
+            moved = self.ids[last]
+            self.matrix[row] = self.matrix[last]
+            self.ids[row] = moved
+            self.rows[moved] = row
+        self.ids.pop()
+
+    def nearest(self, vec: "np.ndarray") -> Optional[Tuple[int, float]]:
+        if not self.ids:
+            return None
+        scores = self.matrix[: len(self.ids)] @ vec
+        row = int(np.argmax(scores))
+        return self.ids[row], float(scores[row])
+
+
+class _HNSWIndex:
+    """Approximate nearest-neighbour index backed by hnswlib"""
+
+    def __init__(self, dim: int):
+        self.index = hnswlib.Index(space="cosine", dim=dim)
+        self.index.init_index(
+            max_elements=16, ef_construction=200, M=16, allow_replace_deleted=True
+        )
+        self.index.set_ef(64)
+        self.live = 0
+
+    def __len__(self) -> int:
+        return self.live
+
+    def add(self, id: int, vec: "np.ndarray") -> None:
+        # Deleted slots are reused, so only grow once every slot is live
+        if self.live == self.index.get_max_elements():
+            self.index.resize_index(self.live * 2)
+        self.index.add_items(vec.reshape(1, -1), [id], replace_deleted=True)
+        self.live += 1
+
+    def remove(self, id: int) -> None:
+        self.index.mark_deleted(id)
+        self.live -= 1
+
+    def nearest(self, vec: "np.ndarray") -> Optional[Tuple[int, float]]:
+        if not self.live:
+            return None
+        try:
+            labels, distances = self.index.knn_query(vec, k=1)
+        except RuntimeError:
+            return None
+        return int(labels[0][0]), 1.0 - float(distances[0][0])
+
+
+class _LSHIndex:
+    """
+    Random-projection LSH index in pure Python
+
+    Candidates sharing a bucket in any table are re-ranked by exact cosine
+    similarity. Hyperplanes are shared by every index of the same cache.
+    """
+
+    def __init__(self, planes: List[List[List[float]]]):
+        self.planes = planes
+        self.tables: List[Dict[int, Set[int]]] = [{} for _ in planes]
+        self.vectors: Dict[int, Tuple[List[float], List[int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    def _keys(self, vec: List[float]) -> List[int]:
+        keys = []
+        for table_planes in self.planes:
+            key = 0
+            for plane in table_planes:
+                key = (key << 1) | (sum(p * x for p, x in zip(plane, vec)) >= 0)
+            keys.append(key)
+        return keys
+
+    def add(self, id: int, vec: Sequence[float]) -> None:
+        vec = [float(x) for x in vec]
+        keys = self._keys(vec)
+        for table, key in zip(self.tables, keys):
+            table.setdefault(key, set()).add(id)
+        self.vectors[id] = (vec, keys)
+
+    def remove(self, id: int) -> None:
+        _, keys = self.vectors.pop(id)
+        for table, key in zip(self.tables, keys):
+            bucket = table[key]
+            bucket.discard(id)
+            if not bucket:
+                del table[key]
+
+    def nearest(self, vec: Sequence[float]) -> Optional[Tuple[int, float]]:
+        vec = [float(x) for x in vec]
+        candidates: Set[int] = set()
+        for table, key in zip(self.tables, self._keys(vec)):
+            candidates |= table.get(key, set())
+        best = None
+        for id in candidates:
+            score = sum(a * b for a, b in zip(self.vectors[id][0], vec))
+            if best is None or score > best[1]:
+                best = (id, score)
+        return best
+
+
+class SemanticCache:
+    """
+    Client-side cache that serves responses for semantically similar inputs
+
+    Used by ``ai.chat`` (keyed on the last user message) and
+    ``memory.search`` (keyed on the query text). A cached response is only
+    returned when all other request parameters match exactly and the cosine
+    similarity of the embeddings is at least ``threshold``.
+
+    Backends:
+        - ``"flat"``: exact linear scan over a numpy matrix (``pip install mirra-sdk[cache]``)
+        - ``"hnsw"``: HNSW graph via hnswlib, O(log N) lookups for large caches
+          (``pip install mirra-sdk[cache-hnsw]``)
+        - ``"lsh"``: random-projection LSH with no third-party dependencies
+
+    Args:
+        embed_fn: Callable returning an embedding vector for a string
+        threshold: Minimum cosine similarity for a cache hit
+        max_entries: Maximum number of cached responses (least recently used evicted first)
+        ttl: Seconds an entry stays valid (None disables expiry)
+        backend: Index used for similarity lookups ("flat", "hnsw" or "lsh")
+
+    Example:
+        >>> from sentence_transformers import SentenceTransformer
+        >>> from mirra import MirraSDK, SemanticCache
+        >>> model = SentenceTransformer("all-MiniLM-L6-v2")
+        >>> mirra = MirraSDK(api_key="your_api_key", cache=SemanticCache(model.encode))
+    """
+
+    def __init__(
+        self,
+        embed_fn: EmbedFn,
+        threshold: float = 0.9,
+        max_entries: int = 1024,
+        ttl: Optional[float] = 600,
+        backend: str = "flat",
+    ):
+        if backend not in ("flat", "hnsw", "lsh"):
+            raise ValueError(f"Unknown SemanticCache backend: {backend!r}")
+        if backend != "lsh" and np is None:
+            raise ImportError(
+                f"The {backend!r} backend requires numpy. Install it with: pip install mirra-sdk[cache]"
+            )
+        if backend == "hnsw" and hnswlib is None:
+            raise ImportError(
+                "The 'hnsw' backend requires hnswlib. Install it with: pip install mirra-sdk[cache-hnsw]"
+            )
+        self.backend = backend
+        self.embed_fn = embed_fn
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # id -> (scope, expires_at, encoded payload), in LRU order
+        self._entries: "OrderedDict[int, Tuple[bytes, float, bytes]]" = OrderedDict()
+        self._indexes: Dict[bytes, Any] = {}
+        # Random hyperplanes shared by every LSH index, and their dimension
+        self._lsh_planes: Optional[List[List[List[float]]]] = None
+        self._lsh_dim = 0
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def embed(self, text: str) -> Sequence[float]:
+        """Embed text and L2-normalize the result"""
+        if np is None:
+            vec = [float(x) for x in self.embed_fn(text)]
+            norm = math.sqrt(sum(x * x for x in vec))
+            return [x / norm for x in vec] if norm else vec
+        vec = np.asarray(self.embed_fn(text), dtype=np.float32).ravel()
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+
+    def lookup(self, vec: Sequence[float], scope: bytes = b"") -> Optional[Any]:
+        """Return the cached payload closest to ``vec``, or None on a miss"""
+        with self._lock:
+            index = self._indexes.get(scope)
+            if index is None:
+                return None
+            match = index.nearest(vec)
+            if match is None or match[1] < self.threshold:
+                return None
+            id = match[0]
+            _, expires_at, payload = self._entries[id]
+            if expires_at < time.monotonic():
+                self._remove(id)
+                return None
+            self._entries.move_to_end(id)
+        # Decode a fresh copy so callers can't mutate the cached entry
+        return orjson.loads(payload)
+
+    def put(self, vec: Sequence[float], payload: Any, scope: bytes = b"") -> None:
+        """Store a payload under ``vec``"""
+        encoded = orjson.dumps(payload)
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            index = self._indexes.get(scope)
+            if index is None:
+                index = self._indexes[scope] = self._new_index(len(vec))
+            id = self._next_id
+            self._next_id += 1
+            index.add(id, vec)
+            self._entries[id] = (scope, expires_at, encoded)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """Remove all cached entries, or only those of ``namespace``"""
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                self._indexes.clear()
+                return
+            prefix = namespace.encode() + b":"
+            for scope in [s for s in self._indexes if s.startswith(prefix)]:
+                del self._indexes[scope]
+            for id in [id for id, entry in self._entries.items() if entry[0].startswith(prefix)]:
+                del self._entries[id]
+
+    def _new_index(self, dim: int) -> Any:
+        if self.backend == "hnsw":
+            return _HNSWIndex(dim)
+        if self.backend == "lsh":
+            if self._lsh_planes is None:
+                rng = random.Random(0)
+                self._lsh_planes = [
+                    [[rng.gauss(0.0, 1.0) for _ in range(dim)] for _ in range(_LSH_BITS)]
+                    for _ in range(_LSH_TABLES)
+                ]
+                self._lsh_dim = dim
+            elif dim != self._lsh_dim:
+                raise ValueError(
+                    f"Embedding has {dim} dimensions, but this cache's LSH planes have {self._lsh_dim}"
+                )
+            return _LSHIndex(self._lsh_planes)
+        return _FlatIndex(dim)
+
+    def _remove(self, id: int) -> None:
+        scope, _, _ = self._entries.pop(id)
+        index = self._indexes[scope]
+        index.remove(id)
+        if not len(index):
+            del self._indexes[scope]
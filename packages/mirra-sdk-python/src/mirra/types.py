@@ -2,7 +2,10 @@
 Mirra SDK Types
 """
 
-from typing import Any, Dict, List, Optional, TypedDict, Literal
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, TypedDict, Literal, Union
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class MirraResponse(TypedDict, total=False):
@@ -18,11 +21,17 @@ class MirraResponse(TypedDict, total=False):
 
 
 class MemoryEntity(TypedDict, total=False):
-    """Memory entity structure"""
+    """
+    Memory entity structure
+
+    ``embedding`` may be a float array or raw little-endian float32 bytes;
+    these are sent as a base64 string with ``embedding_encoding`` set.
+    """
     content: str
     type: Optional[str]
     metadata: Optional[Dict[str, Any]]
-    embedding: Optional[List[float]]
+    embedding: Optional[Union[List[float], "np.ndarray", bytes, str]]
+    embedding_encoding: Optional[Literal["f32b64", "f16b64"]]
 
 
 class MemorySearchQuery(TypedDict, total=False):
@@ -58,6 +67,9 @@ class MemoryUpdateParams(TypedDict, total=False):
 # AI Types
 # ============================================================================
 
+# Allowed values of Literal-typed fields, for O(1) membership checks
+ROLES = frozenset(("user", "assistant", "system"))
+
 
 class ChatMessage(TypedDict):
     """Chat message structure"""
@@ -116,6 +128,8 @@ class BatchChatRequest(TypedDict):
 # Agent Types
 # ============================================================================
 
+AGENT_STATUS = frozenset(("draft", "published"))
+
 
 class Agent(TypedDict, total=False):
     """Agent structure"""
@@ -151,6 +165,9 @@ class UpdateAgentParams(TypedDict, total=False):
 # Script Types
 # ============================================================================
 
+RUNTIMES = frozenset(("nodejs18", "python3.11"))
+SCRIPT_STATUS = frozenset(("draft", "deployed", "failed"))
+
 
 class ScriptConfig(TypedDict, total=False):
     """Script configuration"""
@@ -208,6 +225,8 @@ class ScriptInvocationResult(TypedDict, total=False):
 # Resource Types
 # ============================================================================
 
+RESOURCE_STATUS = frozenset(("active", "inactive"))
+
 
 class Resource(TypedDict, total=False):
     """Resource structure"""
@@ -253,6 +272,8 @@ class Template(TypedDict, total=False):
 # Marketplace Types
 # ============================================================================
 
+MARKETPLACE_TYPES = frozenset(("agent", "script", "resource", "template"))
+
 
 class MarketplaceItem(TypedDict, total=False):
     """Marketplace item"""
@@ -0,0 +1,115 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, NamedTuple
+from urllib.parse import parse_qs, urlsplit
+
+import orjson
+import pytest
+
+from mirra import MirraSDK
+
+API_PREFIX = "/api/sdk/v1"
+
+
+def ok(data: Any) -> tuple:
+    """A successful response envelope"""
+    return 200, {"success": True, "data": data}
+
+
+def fail(status: int, message: str, code: str = None, details: Any = None) -> tuple:
+    """A failed response envelope"""
+    return status, {"success": False, "error": {"message": message, "code": code, "details": details}}
+
+
+class Request(NamedTuple):
+    method: str
+    path: str
+    query: Dict[str, List[str]]
+    body: bytes
+    headers: Dict[str, str]
+
+    def json(self) -> Any:
+        return orjson.loads(self.body)
+
+
+class MockAPI:
+    """
+    Local HTTP server replaying canned API responses
+
+    ``reply(method, path, *responses)`` queues ``(status, payload)`` pairs
+    for a route; the last one repeats. A response may also be a callable
+    taking the ``Request`` and returning the pair. Payloads are JSON-encoded
+    unless they are already bytes. Every request is recorded in ``requests``.
+    """
+
+    def __init__(self):
+        self.routes: Dict[tuple, list] = {}
+        self.requests: List[Request] = []
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def handle_one(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                url = urlsplit(self.path)
+                path = url.path[len(API_PREFIX):] if url.path.startswith(API_PREFIX) else url.path
+                request = Request(
+                    self.command,
+                    path,
+                    parse_qs(url.query, keep_blank_values=True),
+                    body,
+                    {k.lower(): v for k, v in self.headers.items()},
+                )
+                api.requests.append(request)
+                status, payload = api._next(request)
+                raw = payload if isinstance(payload, bytes) else orjson.dumps(payload)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+            do_GET = do_POST = do_PATCH = do_DELETE = handle_one
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}{API_PREFIX}"
+
+    def reply(self, method: str, path: str, *responses: tuple) -> None:
+        self.routes[(method, path)] = list(responses)
+
+    def calls(self, method: str, path: str) -> List[Request]:
+        return [r for r in self.requests if r.method == method and r.path == path]
+
+    def _next(self, request: Request) -> tuple:
+        queue = self.routes.get((request.method, request.path))
+        if not queue:
+            return fail(404, f"No route for {request.method} {request.path}", "NOT_FOUND")
+        response = queue.pop(0) if len(queue) > 1 else queue[0]
+        return response(request) if callable(response) else response
+
+
+def echo_chat(request: Request) -> tuple:
+    """Answer a chat request with the content of its last message"""
+    return ok({"content": request.json()["messages"][-1]["content"], "model": "test"})
+
+
+@pytest.fixture
+def api():
+    api = MockAPI()
+    thread = threading.Thread(target=api.server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield api
+    api.server.shutdown()
+    api.server.server_close()
+
+
+@pytest.fixture
+def client(api):
+    with MirraSDK(api_key="test_key", base_url=api.base_url) as client:
+        yield client
@@ -0,0 +1,110 @@
+import asyncio
+import threading
+
+import pytest
+
+from conftest import echo_chat, fail, ok
+from mirra import AsyncMirraSDK
+from mirra.client import MirraError
+
+aiohttp = pytest.importorskip("aiohttp")
+
+
+def run(api, calls):
+    """Run ``calls(client)`` against the mock API on a fresh event loop"""
+
+    async def main():
+        client = AsyncMirraSDK(api_key="test_key", base_url=api.base_url)
+        try:
+            return await calls(client)
+        finally:
+            await client.close()
+
+    return asyncio.run(main())
+
+
+def test_returns_data(api):
+    api.reply("POST", "/ai/chat", ok({"content": "hi", "model": "m"}))
+    request = {"messages": [{"role": "user", "content": "Hello"}]}
+    result = run(api, lambda client: client.ai.chat(request))
+    assert result == {"content": "hi", "model": "m"}
+    (call,) = api.calls("POST", "/ai/chat")
+    assert call.json() == request
+    assert call.headers["x-api-key"] == "test_key"
+
+
+def test_sends_query_params(api):
+    api.reply("GET", "/marketplace/search", ok([]))
+    assert run(api, lambda client: client.marketplace.search("weather")) == []
+    assert api.calls("GET", "/marketplace/search")[0].query == {"q": ["weather"]}
+
+
+def test_drops_none_params(api):
+    api.reply("GET", "/marketplace", ok([]))
+    assert run(api, lambda client: client.marketplace.browse({"category": "data", "type": None})) == []
+    assert api.calls("GET", "/marketplace")[0].query == {"category": ["data"]}
+
+
+def test_error_envelope_raises(api):
+    api.reply("GET", "/agents/missing", fail(404, "Agent not found", "NOT_FOUND", {"id": "missing"}))
+    with pytest.raises(MirraError) as excinfo:
+        run(api, lambda client: client.agents.get("missing"))
+    assert str(excinfo.value) == "Agent not found"
+    assert excinfo.value.code == "NOT_FOUND"
+    assert excinfo.value.status_code == 404
+    assert excinfo.value.details == {"id": "missing"}
+
+
+def test_success_false_with_ok_status_raises(api):
+    api.reply("GET", "/agents", fail(200, "Quota exceeded", "QUOTA"))
+    with pytest.raises(MirraError, match="Quota exceeded"):
+        run(api, lambda client: client.agents.list())
+
+
+def test_null_error_raises(api):
+    api.reply("GET", "/agents", (200, {"success": False, "error": None}))
+    with pytest.raises(MirraError, match="Unknown error") as excinfo:
+        run(api, lambda client: client.agents.list())
+    assert excinfo.value.status_code == 200
+
+
+def test_invalid_json_raises(api):
+    api.reply("GET", "/agents", (200, b"not json"))
+    with pytest.raises(MirraError, match="Invalid JSON"):
+        run(api, lambda client: client.agents.list())
+
+
+def test_connection_error_raises(api):
+    async def calls(client):
+        client.base_url = "http://127.0.0.1:1"
+        return await client.agents.list()
+
+    with pytest.raises(MirraError, match="Request failed"):
+        run(api, calls)
+
+
+def test_timeout_raises(api):
+    release = threading.Event()
+
+    def slow(request):
+        release.wait(timeout=5)
+        return ok([])
+
+    async def calls(client):
+        client.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=0.05))
+        return await client.agents.list()
+
+    api.reply("GET", "/agents", slow)
+    try:
+        with pytest.raises(MirraError, match="Request failed"):
+            run(api, calls)
+    finally:
+        release.set()
+
+
+def test_batch_chat_parallel_keeps_input_order(api):
+    api.reply("POST", "/ai/chat", echo_chat)
+    request = {"requests": [{"messages": [{"role": "user", "content": c}]} for c in "abcde"]}
+    results = run(api, lambda client: client.ai.batch_chat_parallel(request))
+    assert [r["content"] for r in results] == list("abcde")
+    assert len(api.calls("POST", "/ai/chat")) == 5
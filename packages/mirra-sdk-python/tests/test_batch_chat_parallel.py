@@ -0,0 +1,110 @@
+import threading
+import time
+
+import pytest
+
+from mirra.client import _MAX_THROTTLE_RETRIES, AIService, MirraError
+
+
+def _request(*contents):
+    return {"requests": [{"messages": [{"role": "user", "content": c}]} for c in contents]}
+
+
+def _throttled(retry_after=0.0):
+    return MirraError("slow down", code="RATE_LIMITED", status_code=429, details={"retryAfter": retry_after})
+
+
+def _patch_chat(monkeypatch, chat):
+    calls = []
+    lock = threading.Lock()
+
+    def fake_chat(self, request):
+        content = request["messages"][-1]["content"]
+        with lock:
+            calls.append(content)
+            attempt = calls.count(content)
+        return chat(self, content, attempt)
+
+    monkeypatch.setattr(AIService, "chat", fake_chat)
+    return calls
+
+
+def test_results_keep_input_order(client, monkeypatch):
+    def chat(service, content, attempt):
+        # Later requests finish first
+        time.sleep(0.05 - int(content) * 0.01)
+        return {"content": content}
+
+    _patch_chat(monkeypatch, chat)
+    results = client.ai.batch_chat_parallel(_request("0", "1", "2", "3", "4"))
+    assert [r["content"] for r in results] == ["0", "1", "2", "3", "4"]
+
+
+def test_throttled_request_is_requeued(client, monkeypatch):
+    def chat(service, content, attempt):
+        if content == "b" and attempt == 1:
+            raise _throttled()
+        return {"content": content}
+
+    calls = _patch_chat(monkeypatch, chat)
+    results = client.ai.batch_chat_parallel(_request("a", "b", "c"))
+    assert [r["content"] for r in results] == ["a", "b", "c"]
+    assert calls.count("b") == 2
+
+
+def test_gives_up_after_retry_cap(client, monkeypatch):
+    def chat(service, content, attempt):
+        raise _throttled()
+
+    calls = _patch_chat(monkeypatch, chat)
+    with pytest.raises(MirraError) as excinfo:
+        client.ai.batch_chat_parallel(_request("a"))
+    assert excinfo.value.status_code == 429
+    assert len(calls) == _MAX_THROTTLE_RETRIES + 1
+
+
+def test_non_throttle_error_is_raised(client, monkeypatch):
+    def chat(service, content, attempt):
+        if content == "b":
+            raise MirraError("boom", status_code=500)
+        return {"content": content}
+
+    calls = _patch_chat(monkeypatch, chat)
+    with pytest.raises(MirraError, match="boom"):
+        client.ai.batch_chat_parallel(_request("a", "b", "c"))
+    assert calls.count("b") == 1
+
+
+def test_concurrency_halves_once_per_backoff_window(client, monkeypatch):
+    barrier = threading.Barrier(4)
+    seen = []
+
+    def chat(service, content, attempt):
+        if attempt == 1:
+            # All four first attempts are throttled together
+            barrier.wait(timeout=5)
+            raise _throttled(retry_after=0.2)
+        seen.append(service._concurrency)
+        return {"content": content}
+
+    _patch_chat(monkeypatch, chat)
+    client.ai._concurrency = 4
+    client.ai.batch_chat_parallel(_request("a", "b", "c", "d"))
+    assert seen[0] == 2
+
+
+def test_non_throttle_error_starts_no_more_requests(client, monkeypatch):
+    release = threading.Event()
+
+    def chat(service, content, attempt):
+        if content == "a":
+            release.wait(timeout=5)
+        elif content == "b":
+            threading.Timer(0.05, release.set).start()
+            raise MirraError("boom", status_code=500)
+        return {"content": content}
+
+    calls = _patch_chat(monkeypatch, chat)
+    with pytest.raises(MirraError, match="boom"):
+        client.ai.batch_chat_parallel(_request("a", "b", "c", "d"), max_concurrency=2)
+    assert sorted(calls) == ["a", "b"]
@@ -0,0 +1,33 @@
+import pytest
+
+from conftest import fail, ok
+from mirra.client import MirraError
+
+
+def test_any_2xx_success_returns_data(api, client):
+    api.reply("POST", "/agents", (201, {"success": True, "data": {"id": "a1"}}))
+    assert client.agents.create({"name": "agent"}) == {"id": "a1"}
+
+
+def test_error_envelope_raises(api, client):
+    api.reply("POST", "/ai/decide", fail(422, "Bad options", "VALIDATION", {"field": "options"}))
+    with pytest.raises(MirraError) as excinfo:
+        client.ai.decide({"prompt": "?", "options": []})
+    assert str(excinfo.value) == "Bad options"
+    assert excinfo.value.code == "VALIDATION"
+    assert excinfo.value.status_code == 422
+    assert excinfo.value.details == {"field": "options"}
+
+
+@pytest.mark.parametrize("status", [200, 500])
+def test_null_error_raises(api, client, status):
+    api.reply("GET", "/scripts", (status, {"success": False, "error": None}))
+    with pytest.raises(MirraError, match="Unknown error") as excinfo:
+        client.scripts.list()
+    assert excinfo.value.status_code == status
+
+
+def test_invalid_json_raises(api, client):
+    api.reply("GET", "/scripts", (200, b"<html>"))
+    with pytest.raises(MirraError, match="Invalid JSON"):
+        client.scripts.list()
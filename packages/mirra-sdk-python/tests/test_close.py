@@ -0,0 +1,65 @@
+import asyncio
+import threading
+from concurrent.futures import CancelledError
+
+import pytest
+
+from conftest import ok
+from mirra import AsyncMirraSDK, MirraSDK
+
+
+def test_context_manager_closes_pools_and_executor(api):
+    api.reply("GET", "/agents/a1", ok({"id": "a1"}))
+    api.reply("GET", "/scripts", ok([]))
+    with MirraSDK(api_key="test_key", base_url=api.base_url) as client:
+        assert client.scripts.list() == []
+        assert client.agents.prefetch(["a1"])["a1"] == {"id": "a1"}
+        executor = client._executor
+        assert executor is not None
+    assert client._executor is None
+    assert len(client._pool.pools) == 0
+    assert all(not adapter.poolmanager.pools for adapter in client.session.adapters.values())
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+
+
+def test_close_is_idempotent(api):
+    client = MirraSDK(api_key="test_key", base_url=api.base_url)
+    client.close()
+    client.close()
+
+
+def test_close_cancels_queued_prefetches(api):
+    release = threading.Event()
+
+    def slow(request):
+        release.wait(timeout=5)
+        return ok({"id": request.path.rsplit("/", 1)[1]})
+
+    ids = [f"a{i}" for i in range(12)]
+    for id in ids:
+        api.reply("GET", f"/agents/{id}", slow)
+    client = MirraSDK(api_key="test_key", base_url=api.base_url)
+    try:
+        agents = client.agents.prefetch(ids)
+        client.close()
+    finally:
+        release.set()
+    # The executor has 8 workers, so the last four were still queued
+    for id in ids[8:]:
+        with pytest.raises(CancelledError):
+            agents[id]
+
+
+def test_async_context_manager_closes_session(api):
+    pytest.importorskip("aiohttp")
+    api.reply("GET", "/agents", ok([]))
+
+    async def main():
+        async with AsyncMirraSDK(api_key="test_key", base_url=api.base_url) as client:
+            assert await client.agents.list() == []
+            session = client.session
+        assert session.closed
+        assert client.session is None
+
+    asyncio.run(main())
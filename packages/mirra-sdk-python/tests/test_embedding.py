@@ -0,0 +1,57 @@
+import base64
+
+import pytest
+
+from conftest import ok
+from mirra.prepared import _encode_embedding
+
+np = pytest.importorskip("numpy")
+
+
+def _decode(entity, dtype):
+    return np.frombuffer(base64.b64decode(entity["embedding"]), dtype=dtype)
+
+
+@pytest.mark.parametrize("embedding", [[0.1, 0.2], (0.1, 0.2)])
+def test_sequences_are_sent_unchanged(embedding):
+    entity = {"content": "x", "embedding": embedding}
+    assert _encode_embedding(entity) is entity
+
+
+def test_unsupported_type_raises():
+    with pytest.raises(TypeError, match="generator"):
+        _encode_embedding({"embedding": (x for x in [0.1])})
+
+
+def test_missing_embedding_is_unchanged():
+    entity = {"content": "x"}
+    assert _encode_embedding(entity) is entity
+
+
+def test_array_is_packed_as_float32():
+    entity = _encode_embedding({"content": "x", "embedding": np.array([0.5, -1.25, 3.0])})
+    assert entity["embedding_encoding"] == "f32b64"
+    assert _decode(entity, "<f4").tolist() == [0.5, -1.25, 3.0]
+    assert entity["content"] == "x"
+
+
+def test_array_is_packed_as_float16():
+    entity = _encode_embedding({"embedding": np.array([0.5, -1.25, 3.0])}, half_precision=True)
+    assert entity["embedding_encoding"] == "f16b64"
+    assert _decode(entity, "<f2").tolist() == [0.5, -1.25, 3.0]
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+def test_bytes_are_sent_as_float32(wrap):
+    raw = np.array([1.0, 2.0], dtype="<f4").tobytes()
+    entity = _encode_embedding({"embedding": wrap(raw)})
+    assert entity["embedding_encoding"] == "f32b64"
+    assert base64.b64decode(entity["embedding"]) == raw
+
+
+def test_create_uploads_packed_embedding(api, client):
+    api.reply("POST", "/memory", ok({"id": "m1"}))
+    client.memory.create({"type": "note", "content": "x", "embedding": np.ones(4)}, half_precision=True)
+    body = api.calls("POST", "/memory")[0].json()
+    assert body["embedding_encoding"] == "f16b64"
+    assert _decode(body, "<f2").tolist() == [1.0] * 4
@@ -0,0 +1,62 @@
+import pytest
+
+from conftest import echo_chat, fail, ok
+from mirra import MirraSDK
+from mirra.client import MirraError
+
+pytest.importorskip("h2")
+httpx = pytest.importorskip("httpx")
+
+
+@pytest.fixture
+def client(api):
+    client = MirraSDK(api_key="test_key", base_url=api.base_url, http2=True)
+    yield client
+    client.session.close()
+
+
+def test_requests_go_through_httpx(api, client):
+    api.reply("POST", "/ai/chat", echo_chat)
+    api.reply("GET", "/agents/a1", ok({"id": "a1"}))
+    api.reply("GET", "/marketplace/search", ok([]))
+    assert isinstance(client.session, httpx.Client)
+    assert client.ai.chat({"messages": [{"role": "user", "content": "hi"}]})["content"] == "hi"
+    assert client.agents.get("a1") == {"id": "a1"}
+    assert client.marketplace.search("maps") == []
+    for call in api.requests:
+        assert call.headers["x-api-key"] == "test_key"
+        assert call.headers["user-agent"].startswith("python-httpx")
+    assert api.calls("GET", "/marketplace/search")[0].query == {"q": ["maps"]}
+
+
+def test_errors_are_unwrapped(api, client):
+    api.reply("GET", "/agents/missing", fail(404, "Agent not found", "NOT_FOUND"))
+    with pytest.raises(MirraError) as excinfo:
+        client.agents.get("missing")
+    assert excinfo.value.status_code == 404
+
+
+def test_connection_errors_are_wrapped(client):
+    client.base_url = "http://127.0.0.1:1"
+    with pytest.raises(MirraError, match="Request failed"):
+        client.agents.get("a1")
+
+
+def test_streams_items(api, client):
+    pytest.importorskip("ijson")
+    items = [{"id": str(i)} for i in range(500)]
+    api.reply("GET", "/agents", ok(items))
+    api.reply("GET", "/marketplace", fail(500, "Internal error"))
+    assert list(client.agents.iter_list()) == items
+    with pytest.raises(MirraError) as excinfo:
+        list(client.marketplace.iter_browse())
+    assert excinfo.value.status_code == 500
+
+
+def test_none_params_are_dropped(api, client):
+    pytest.importorskip("ijson")
+    api.reply("GET", "/marketplace", ok([]))
+    filters = {"type": None, "category": "data", "limit": None}
+    assert client.marketplace.browse(filters) == []
+    assert list(client.marketplace.iter_browse(filters)) == []
+    assert [call.query for call in api.calls("GET", "/marketplace")] == [{"category": ["data"]}] * 2
@@ -0,0 +1,69 @@
+import threading
+
+import pytest
+
+from conftest import fail, ok
+from mirra.client import MirraError
+
+
+def _agent(request):
+    return ok({"id": request.path.rsplit("/", 1)[1]})
+
+
+def test_results_by_id(api, client):
+    api.reply("GET", "/agents/a1", _agent)
+    api.reply("GET", "/agents/a2", _agent)
+    agents = client.agents.prefetch(["a1", "a2"])
+    assert list(agents) == ["a1", "a2"]
+    assert len(agents) == 2
+    assert agents["a2"] == {"id": "a2"}
+    assert dict(agents) == {"a1": {"id": "a1"}, "a2": {"id": "a2"}}
+
+
+def test_as_completed_yields_every_result(api, client):
+    for id in ("s1", "s2", "s3"):
+        api.reply("GET", f"/scripts/{id}", ok({"id": id}))
+    scripts = client.scripts.prefetch(["s1", "s2", "s3"])
+    assert sorted(scripts.as_completed()) == [(id, {"id": id}) for id in ("s1", "s2", "s3")]
+
+
+def test_lookup_reraises_the_fetch_error(api, client):
+    api.reply("GET", "/agents/a1", _agent)
+    api.reply("GET", "/agents/missing", fail(404, "Agent not found", "NOT_FOUND"))
+    agents = client.agents.prefetch(["a1", "missing"])
+    assert agents["a1"] == {"id": "a1"}
+    with pytest.raises(MirraError) as excinfo:
+        agents["missing"]
+    assert excinfo.value.status_code == 404
+
+
+def test_unknown_id_raises_key_error(api, client):
+    api.reply("GET", "/agents/a1", _agent)
+    with pytest.raises(KeyError):
+        client.agents.prefetch(["a1"])["a2"]
+
+
+def test_duplicate_ids_are_fetched_once(api, client):
+    api.reply("GET", "/agents/a1", _agent)
+    api.reply("GET", "/agents/a2", _agent)
+    agents = client.agents.prefetch(["a2", "a1", "a2", "a2"])
+    assert list(agents) == ["a2", "a1"]
+    assert dict(agents) == {"a1": {"id": "a1"}, "a2": {"id": "a2"}}
+    assert len(api.calls("GET", "/agents/a2")) == 1
+
+
+def test_membership_does_not_wait_or_raise(api, client):
+    release = threading.Event()
+
+    def slow_failure(request):
+        release.wait(timeout=5)
+        return fail(500, "Server error")
+
+    api.reply("GET", "/agents/a1", slow_failure)
+    agents = client.agents.prefetch(["a1"])
+    assert "a1" in agents
+    assert "a2" not in agents
+    assert not agents._futures["a1"].done()
+    release.set()
+    with pytest.raises(MirraError):
+        agents["a1"]
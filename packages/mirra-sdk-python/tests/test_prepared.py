@@ -0,0 +1,45 @@
+import base64
+
+import orjson
+import pytest
+
+from conftest import ok
+from mirra import PreparedEntity
+
+
+def test_encode_matches_full_entity():
+    fields = {"type": "note", "metadata": {"source": "import", "tags": ["a"]}}
+    prepared = PreparedEntity(fields)
+    for content in ["first", 'quotes " and \\ backslashes', "ünïcödé"]:
+        assert orjson.loads(prepared.encode(content)) == {**fields, "content": content}
+
+
+def test_content_field_is_replaced():
+    prepared = PreparedEntity({"type": "note", "content": "ignored"})
+    assert orjson.loads(prepared.encode("used")) == {"type": "note", "content": "used"}
+
+
+def test_encode_without_static_fields():
+    assert orjson.loads(PreparedEntity({}).encode("only")) == {"content": "only"}
+
+
+def test_create_prepared_sends_encoded_body(api, client):
+    api.reply("POST", "/memory", ok({"id": "m1"}))
+    prepared = PreparedEntity({"type": "note"})
+    assert client.memory.create_prepared(prepared, "hello") == {"id": "m1"}
+    (call,) = api.calls("POST", "/memory")
+    assert call.json() == {"type": "note", "content": "hello"}
+    assert call.headers["content-type"] == "application/json"
+
+
+@pytest.mark.parametrize("half_precision, dtype, encoding", [
+    (False, "<f4", "f32b64"),
+    (True, "<f2", "f16b64"),
+])
+def test_array_embedding_is_packed(half_precision, dtype, encoding):
+    np = pytest.importorskip("numpy")
+    prepared = PreparedEntity({"type": "note", "embedding": np.array([0.5, 2.0])}, half_precision)
+    body = orjson.loads(prepared.encode("x"))
+    assert body["embedding_encoding"] == encoding
+    assert np.frombuffer(base64.b64decode(body["embedding"]), dtype=dtype).tolist() == [0.5, 2.0]
+    assert body["content"] == "x"
@@ -0,0 +1,54 @@
+import pytest
+from urllib3.exceptions import ReadTimeoutError
+
+from conftest import fail, ok
+from mirra.client import MirraError, _ThrottleRetry
+
+
+@pytest.fixture
+def retries(client):
+    return client.session.get_adapter(client.base_url).max_retries
+
+
+def test_adapter_uses_throttle_retry(retries):
+    assert isinstance(retries, _ThrottleRetry)
+
+
+@pytest.mark.parametrize("method", ["POST", "PATCH", "GET", "DELETE"])
+def test_every_method_retries_on_429(retries, method):
+    assert retries.is_retry(method, 429)
+
+
+@pytest.mark.parametrize("status", [502, 503, 504])
+def test_only_idempotent_methods_retry_on_5xx(retries, status):
+    assert retries.is_retry("GET", status)
+    assert retries.is_retry("DELETE", status)
+    assert not retries.is_retry("POST", status)
+    assert not retries.is_retry("PATCH", status)
+
+
+def test_only_idempotent_methods_retry_read_errors(retries):
+    error = ReadTimeoutError(None, "/agents", "read timed out")
+    assert retries.increment("GET", "/agents", error=error).total == retries.total - 1
+    with pytest.raises(ReadTimeoutError):
+        retries.increment("POST", "/agents", error=error)
+
+
+def test_post_is_not_resent_after_5xx(api, client):
+    api.reply("POST", "/ai/chat", fail(503, "Unavailable"), ok({"content": "late"}))
+    with pytest.raises(MirraError) as excinfo:
+        client.ai.chat({"messages": [{"role": "user", "content": "hi"}]})
+    assert excinfo.value.status_code == 503
+    assert len(api.calls("POST", "/ai/chat")) == 1
+
+
+def test_post_is_resent_after_429(api, client):
+    api.reply("POST", "/ai/chat", fail(429, "Slow down"), ok({"content": "hi"}))
+    assert client.ai.chat({"messages": [{"role": "user", "content": "hi"}]}) == {"content": "hi"}
+    assert len(api.calls("POST", "/ai/chat")) == 2
+
+
+def test_get_is_resent_after_5xx(api, client):
+    api.reply("GET", "/scripts", fail(502, "Bad gateway"), ok([]))
+    assert client.scripts.list() == []
+    assert len(api.calls("GET", "/scripts")) == 2
@@ -0,0 +1,151 @@
+import time
+
+import pytest
+
+from conftest import echo_chat, ok
+from mirra import MirraSDK, SemanticCache
+from mirra.semcache import make_scope
+
+VECTORS = {
+    "hello": [1.0, 0.0, 0.0],
+    "hello!": [0.99, 0.1, 0.0],
+    "goodbye": [0.0, 1.0, 0.0],
+    "other": [0.0, 0.0, 1.0],
+}
+
+
+def _backends():
+    for backend, modules in (("flat", ["numpy"]), ("hnsw", ["numpy", "hnswlib"]), ("lsh", [])):
+        marks = []
+        for module in modules:
+            try:
+                __import__(module)
+            except ImportError:
+                marks.append(pytest.mark.skip(reason=f"{module} is not installed"))
+        yield pytest.param(backend, marks=marks)
+
+
+@pytest.fixture(params=list(_backends()))
+def make_cache(request):
+    def make(**kwargs):
+        return SemanticCache(VECTORS.__getitem__, backend=request.param, **kwargs)
+
+    return make
+
+
+def test_similar_text_hits(make_cache):
+    cache = make_cache()
+    cache.put(cache.embed("hello"), {"answer": 1})
+    assert cache.lookup(cache.embed("hello")) == {"answer": 1}
+    assert cache.lookup(cache.embed("hello!")) == {"answer": 1}
+
+
+def test_dissimilar_text_misses(make_cache):
+    cache = make_cache()
+    cache.put(cache.embed("hello"), {"answer": 1})
+    assert cache.lookup(cache.embed("goodbye")) is None
+
+
+def test_threshold(make_cache):
+    cache = make_cache(threshold=0.999)
+    cache.put(cache.embed("hello"), {"answer": 1})
+    assert cache.lookup(cache.embed("hello!")) is None
+
+
+def test_scopes_are_isolated(make_cache):
+    cache = make_cache()
+    cache.put(cache.embed("hello"), "gpt", make_scope("ai.chat", {"model": "gpt"}))
+    assert cache.lookup(cache.embed("hello"), make_scope("ai.chat", {"model": "other"})) is None
+    assert cache.lookup(cache.embed("hello"), make_scope("ai.chat", {"model": "gpt"})) == "gpt"
+
+
+def test_expired_entries_miss(make_cache):
+    cache = make_cache(ttl=0.01)
+    cache.put(cache.embed("hello"), {"answer": 1})
+    time.sleep(0.02)
+    assert cache.lookup(cache.embed("hello")) is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_is_evicted(make_cache):
+    cache = make_cache(max_entries=2)
+    cache.put(cache.embed("hello"), 1)
+    cache.put(cache.embed("goodbye"), 2)
+    assert cache.lookup(cache.embed("hello")) == 1
+    cache.put(cache.embed("other"), 3)
+    assert len(cache) == 2
+    assert cache.lookup(cache.embed("goodbye")) is None
+    assert cache.lookup(cache.embed("hello")) == 1
+    assert cache.lookup(cache.embed("other")) == 3
+
+
+def test_lookup_returns_a_copy(make_cache):
+    cache = make_cache()
+    cache.put(cache.embed("hello"), {"items": [1]})
+    cache.lookup(cache.embed("hello"))["items"].append(2)
+    assert cache.lookup(cache.embed("hello")) == {"items": [1]}
+
+
+def test_clear_namespace(make_cache):
+    cache = make_cache()
+    cache.put(cache.embed("hello"), "search", make_scope("memory.search", {}))
+    cache.put(cache.embed("hello"), "chat", make_scope("ai.chat", {}))
+    cache.clear("memory.search")
+    assert cache.lookup(cache.embed("hello"), make_scope("memory.search", {})) is None
+    assert cache.lookup(cache.embed("hello"), make_scope("ai.chat", {})) == "chat"
+    assert len(cache) == 1
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        SemanticCache(VECTORS.__getitem__, backend="annoy")
+
+
+def test_lsh_rejects_a_second_dimension():
+    cache = SemanticCache(VECTORS.__getitem__, backend="lsh")
+    cache.put([1.0, 0.0, 0.0], 1, make_scope("ai.chat", {"model": "small"}))
+    with pytest.raises(ValueError, match="dimensions"):
+        cache.put([1.0, 0.0, 0.0, 0.0], 2, make_scope("ai.chat", {"model": "large"}))
+    assert len(cache) == 1
+
+
+def test_chat_is_served_from_cache(api, make_cache):
+    api.reply("POST", "/ai/chat", echo_chat)
+    client = MirraSDK(api_key="test_key", base_url=api.base_url, cache=make_cache())
+
+    def chat(content, model="m1"):
+        return client.ai.chat({"model": model, "messages": [{"role": "user", "content": content}]})
+
+    assert chat("hello")["content"] == "hello"
+    assert chat("hello!")["content"] == "hello"
+    assert chat("hello!", model="m2")["content"] == "hello!"
+    assert chat("goodbye")["content"] == "goodbye"
+    assert len(api.calls("POST", "/ai/chat")) == 3
+    client.session.close()
+
+
+def test_memory_search_is_served_from_cache(api, make_cache):
+    api.reply("POST", "/memory/search", ok([{"id": "1", "score": 0.9}]))
+    client = MirraSDK(api_key="test_key", base_url=api.base_url, cache=make_cache())
+    first = client.memory.search({"query": "hello", "limit": 5})
+    assert client.memory.search({"query": "hello!", "limit": 5}) == first
+    client.memory.search({"query": "hello", "limit": 10})
+    assert len(api.calls("POST", "/memory/search")) == 2
+    client.session.close()
+
+
+@pytest.mark.parametrize("write", [
+    lambda memory: memory.create({"type": "note", "content": "hello"}),
+    lambda memory: memory.update("1", {"content": "hello"}),
+    lambda memory: memory.delete("1"),
+])
+def test_memory_writes_invalidate_searches(api, make_cache, write):
+    api.reply("POST", "/memory/search", lambda request: ok([{"id": str(len(api.requests))}]))
+    for path in ("/memory", "/memory/update", "/memory/delete"):
+        api.reply("POST", path, ok({"success": True}))
+    with MirraSDK(api_key="test_key", base_url=api.base_url, cache=make_cache()) as client:
+        first = client.memory.search({"query": "hello"})
+        assert client.memory.search({"query": "hello"}) == first
+        write(client.memory)
+        assert client.memory.search({"query": "hello"}) != first
+    assert len(api.calls("POST", "/memory/search")) == 2
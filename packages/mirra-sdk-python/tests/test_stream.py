@@ -0,0 +1,57 @@
+import pytest
+
+from conftest import fail, ok
+
+pytest.importorskip("ijson")
+
+from mirra.client import MirraError  # noqa: E402
+
+
+def test_yields_items(api, client):
+    items = [{"id": str(i), "tags": ["a", {"b": i}], "score": i / 2} for i in range(2000)]
+    api.reply("GET", "/agents", ok(items))
+    assert list(client.agents.iter_list()) == items
+
+
+def test_success_after_data(api, client):
+    api.reply("GET", "/agents", (200, {"data": [{"id": "1"}], "success": True}))
+    assert list(client.agents.iter_list()) == [{"id": "1"}]
+
+
+def test_sends_params_and_body(api, client):
+    api.reply("GET", "/marketplace", ok([]))
+    api.reply("POST", "/memory/query", ok([{"id": "1"}]))
+    assert list(client.marketplace.iter_browse({"category": "data"})) == []
+    assert list(client.memory.iter_query({"type": "note", "limit": 5})) == [{"id": "1"}]
+    assert api.calls("GET", "/marketplace")[0].query == {"category": ["data"]}
+    assert api.calls("POST", "/memory/query")[0].json() == {"type": "note", "limit": 5}
+
+
+def test_error_status_raises(api, client):
+    api.reply("GET", "/agents", fail(403, "Forbidden", "FORBIDDEN"))
+    with pytest.raises(MirraError) as excinfo:
+        list(client.agents.iter_list())
+    assert excinfo.value.status_code == 403
+    assert excinfo.value.code == "FORBIDDEN"
+
+
+def test_success_false_with_ok_status_raises(api, client):
+    api.reply("GET", "/agents", fail(200, "Quota exceeded", "QUOTA", {"limit": 10}))
+    with pytest.raises(MirraError) as excinfo:
+        list(client.agents.iter_list())
+    assert str(excinfo.value) == "Quota exceeded"
+    assert excinfo.value.code == "QUOTA"
+    assert excinfo.value.status_code == 200
+    assert excinfo.value.details == {"limit": 10}
+
+
+def test_null_error_raises(api, client):
+    api.reply("GET", "/agents", (200, {"success": False, "error": None}))
+    with pytest.raises(MirraError, match="Unknown error"):
+        list(client.agents.iter_list())
+
+
+def test_invalid_json_raises(api, client):
+    api.reply("GET", "/agents", (200, b'{"success": true, "data": [1, 2'))
+    with pytest.raises(MirraError, match="Invalid JSON"):
+        list(client.agents.iter_list())
@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from conftest import ok
+from mirra import MARKETPLACE_TYPES, RUNTIMES, AsyncMirraSDK
+from mirra.client import MirraError
+
+
+def test_invalid_runtime_is_rejected_before_sending(api, client):
+    with pytest.raises(MirraError) as excinfo:
+        client.scripts.create({"name": "s", "code": "", "runtime": "ruby"})
+    assert excinfo.value.code == "INVALID_PARAMS"
+    assert "nodejs18" in str(excinfo.value)
+    assert api.requests == []
+
+
+def test_invalid_marketplace_type_is_rejected_before_sending(api, client):
+    with pytest.raises(MirraError) as excinfo:
+        client.marketplace.browse({"type": "plugin"})
+    assert excinfo.value.code == "INVALID_PARAMS"
+    assert api.requests == []
+
+
+def test_valid_values_are_sent(api, client):
+    api.reply("POST", "/scripts", ok({"id": "s1"}))
+    api.reply("GET", "/marketplace", ok([]))
+    for runtime in RUNTIMES:
+        client.scripts.create({"name": "s", "code": "", "runtime": runtime})
+    for type in MARKETPLACE_TYPES:
+        client.marketplace.browse({"type": type})
+    client.marketplace.browse()
+    assert len(api.requests) == len(RUNTIMES) + len(MARKETPLACE_TYPES) + 1
+
+
+def test_streamed_browse_is_validated(api, client):
+    with pytest.raises(MirraError, match="Invalid type"):
+        client.marketplace.iter_browse({"type": "plugin"})
+    assert api.requests == []
+
+
+def test_async_client_is_validated(api):
+    pytest.importorskip("aiohttp")
+
+    async def main():
+        async with AsyncMirraSDK(api_key="test_key", base_url=api.base_url) as client:
+            with pytest.raises(MirraError, match="Invalid runtime"):
+                await client.scripts.create({"name": "s", "code": "", "runtime": "ruby"})
+            with pytest.raises(MirraError, match="Invalid type"):
+                await client.marketplace.browse({"type": "plugin"})
+
+    asyncio.run(main())
+    assert api.requests == []